@@ -1,33 +1,218 @@
+import array
+import asyncio
+import functools
+import hashlib
+import json
 import os
+import re
 import threading
 import time
-from collections import deque
-from typing import Any, Deque, Dict, List, Literal, Optional
+import uuid
+from datetime import datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+)
+
+import orjson
+from anyio import to_thread
+
+try:
+    import redis as redis_lib
+except ImportError:  # Redis is optional; limits stay in-process without it.
+    redis_lib = None
 
-from fastapi import FastAPI, HTTPException, Request
+from cachetools import TTLCache
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from kubernetes import client, config
+from fastapi.responses import ORJSONResponse
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 APP_NAMESPACE = os.getenv("PLATFORM_NAMESPACE", "store-platform")
 CRD_GROUP = os.getenv("STORE_CRD_GROUP", "stores.urumi.ai")
 CRD_VERSION = os.getenv("STORE_CRD_VERSION", "v1alpha1")
 CRD_PLURAL = os.getenv("STORE_CRD_PLURAL", "stores")
 
+# Hoisted per-request constants for the create/list hot paths.
+_API_VERSION = f"{CRD_GROUP}/{CRD_VERSION}"
+_CRD_KW = {
+    "group": CRD_GROUP,
+    "version": CRD_VERSION,
+    "namespace": APP_NAMESPACE,
+    "plural": CRD_PLURAL,
+}
+_STORE_ID_RE = re.compile(r"^[a-z0-9-]+$")
+_STORES_PATH = f"/apis/{CRD_GROUP}/{CRD_VERSION}/namespaces/{APP_NAMESPACE}/{CRD_PLURAL}"
+# Salted hash label so the apiserver can filter stores by requester without
+# leaking raw IPs into etcd.
+_IP_HASH_LABEL = "urumi.ai/requested-ip-hash"
+
+
+def _ip_hash(ip: str) -> str:
+    return hashlib.sha1((IP_HASH_SALT + ip).encode()).hexdigest()[:8]
+
 MAX_ACTIVE_STORES = int(os.getenv("MAX_ACTIVE_STORES", "5"))
 MAX_STORES_PER_IP = int(os.getenv("MAX_STORES_PER_IP", "3"))
 CREATE_RATE_LIMIT = int(os.getenv("CREATE_RATE_LIMIT", "5"))
 RATE_WINDOW_SECONDS = int(os.getenv("RATE_WINDOW_SECONDS", "60"))
 EVENTS_LIMIT = int(os.getenv("EVENTS_LIMIT", "20"))
+CACHE_RELIST_SECONDS = int(os.getenv("CACHE_RELIST_SECONDS", "300"))
+CACHE_SYNC_WAIT_SECONDS = float(os.getenv("CACHE_SYNC_WAIT_SECONDS", "2"))
+OWN_WRITE_WAIT_SECONDS = float(os.getenv("OWN_WRITE_WAIT_SECONDS", "0.2"))
+OWN_WRITE_TTL_SECONDS = float(os.getenv("OWN_WRITE_TTL_SECONDS", "30"))
+CREATE_CONCURRENCY = int(os.getenv("CREATE_CONCURRENCY", "8"))
+IP_HASH_SALT = os.getenv("IP_HASH_SALT", "urumi-store-api")
+REDIS_URL = os.getenv("REDIS_URL", "")
+LIST_RESPONSE_TTL_SECONDS = float(os.getenv("LIST_RESPONSE_TTL_SECONDS", "2"))
+STORE_RESPONSE_TTL_SECONDS = float(os.getenv("STORE_RESPONSE_TTL_SECONDS", "10"))
+STALE_RESPONSE_TTL_SECONDS = float(os.getenv("STALE_RESPONSE_TTL_SECONDS", "3600"))
 CORS_ALLOW_ORIGINS = [
     origin.strip()
     for origin in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
     if origin.strip()
 ]
 
-_rate_limit_lock = threading.Lock()
-_ip_create_requests: Dict[str, Deque[float]] = {}
+# Sliding-window limiter: each IP owns a ring of its last CREATE_RATE_LIMIT
+# accept timestamps. The check is one modulo plus one compare (no per-request
+# expiry sweep) while keeping exact window semantics; locks are sharded so
+# unrelated IPs do not serialize on one mutex.
+_RATE_LIMIT = max(CREATE_RATE_LIMIT, 1)
+_RATE_LOCK_SHARDS = 64
+_rate_locks = [threading.Lock() for _ in range(_RATE_LOCK_SHARDS)]
+
+
+def _rate_lock_for(ip: str) -> threading.Lock:
+    return _rate_locks[hash(ip) & (_RATE_LOCK_SHARDS - 1)]
+
+
+class _RateLimiterState:
+    """Slab-pooled limiter state in structure-of-arrays layout.
+
+    All rings live in one contiguous array.array('d') (slabs of _RATE_LIMIT
+    doubles) with parallel head/ip arrays, so the periodic expiry sweep is a
+    linear scan over one buffer instead of chasing per-IP heap objects.
+    Freed slabs are recycled through a freelist.
+    """
+
+    def __init__(self) -> None:
+        self._ts = array.array("d")  # slab i -> last _RATE_LIMIT accepts
+        self._heads = array.array("l")  # slab i -> accept counter
+        self._ips: List[Optional[str]] = []  # slab i -> owning IP
+        self._slots: Dict[str, int] = {}  # ip -> slab index
+        self._free: List[int] = []
+        self._alloc_lock = threading.Lock()
+
+    def _allocate_locked(self, ip: str) -> int:
+        with self._alloc_lock:
+            if self._free:
+                slot = self._free.pop()
+                base = slot * _RATE_LIMIT
+                for i in range(base, base + _RATE_LIMIT):
+                    self._ts[i] = 0.0
+                self._heads[slot] = 0
+                self._ips[slot] = ip
+            else:
+                slot = len(self._heads)
+                self._ts.extend([0.0] * _RATE_LIMIT)
+                self._heads.append(0)
+                self._ips.append(ip)
+            self._slots[ip] = slot
+            return slot
+
+    def check(self, ip: str, now: float) -> bool:
+        """Record an accept and return True, or return False at the limit.
+
+        Caller must hold the IP's shard lock.
+        """
+        slot = self._slots.get(ip)
+        if slot is None:
+            slot = self._allocate_locked(ip)
+        base = slot * _RATE_LIMIT
+        head = self._heads[slot]
+        idx = base + head % _RATE_LIMIT
+        # _ts[idx] is the accept that would fall out of the window; if it is
+        # still inside the window, the limit is currently exhausted.
+        if head >= _RATE_LIMIT and now - self._ts[idx] <= RATE_WINDOW_SECONDS:
+            return False
+        self._ts[idx] = now
+        self._heads[slot] = head + 1
+        return True
+
+    def _latest(self, slot: int) -> float:
+        head = self._heads[slot]
+        if not head:
+            return 0.0
+        return self._ts[slot * _RATE_LIMIT + (head - 1) % _RATE_LIMIT]
+
+    def sweep(self, cutoff: float) -> None:
+        for slot in range(len(self._heads)):
+            ip = self._ips[slot]
+            if ip is None or self._latest(slot) >= cutoff:
+                continue
+            with _rate_lock_for(ip):
+                if self._slots.get(ip) != slot or self._latest(slot) >= cutoff:
+                    continue
+                with self._alloc_lock:
+                    self._slots.pop(ip, None)
+                    self._ips[slot] = None
+                    self._free.append(slot)
+
+
+_rate_state = _RateLimiterState()
+
+
+def _sweep_rate_limiter() -> None:
+    while True:
+        time.sleep(RATE_WINDOW_SECONDS)
+        _rate_state.sweep(time.time() - RATE_WINDOW_SECONDS)
+
+
+threading.Thread(target=_sweep_rate_limiter, name="rate-sweeper", daemon=True).start()
+
+# When REDIS_URL is set, rate and in-flight limits are enforced atomically in
+# Redis so they hold across uvicorn workers and API replicas; the in-process
+# ring limiter above remains the fallback when Redis is absent or unreachable.
+# The script is a sliding-window check: prune entries older than the window,
+# reject at the limit, otherwise record this request and refresh the TTL.
+_SLIDING_WINDOW_LUA = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1] - ARGV[2])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then
+  return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[4])
+redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[2])))
+return 1
+"""
+
+_redis_client = None
+_window_script = None
+if REDIS_URL and redis_lib is not None:
+    _redis_client = redis_lib.Redis.from_url(REDIS_URL)
+    _window_script = _redis_client.register_script(_SLIDING_WINDOW_LUA)
+
+
+def _redis_check_rate_limit(ip: str) -> Optional[bool]:
+    """Returns allowed/denied, or None when Redis is not usable."""
+    if _window_script is None:
+        return None
+    try:
+        return bool(
+            _window_script(
+                keys=[f"stores:rl:{ip}"],
+                args=[time.time(), RATE_WINDOW_SECONDS, CREATE_RATE_LIMIT, uuid.uuid4().hex],
+            )
+        )
+    except Exception:
+        return None
 
 
 def _load_kube() -> None:
@@ -39,12 +224,220 @@ def _load_kube() -> None:
 
 
 _load_kube()
+
+# The default urllib3 pool keeps only 4 sockets to the apiserver, which
+# serializes concurrent calls (and re-pays TLS handshakes) under load.
+_k8s_cfg = client.Configuration.get_default_copy()
+_k8s_cfg.connection_pool_maxsize = max(32, (os.cpu_count() or 4) * 8)
+client.Configuration.set_default(_k8s_cfg)
+
 co_api = client.CustomObjectsApi()
 
+# Shared across DELETE calls; background propagation lets the apiserver reap
+# dependents asynchronously instead of holding the response on the finalizer
+# chain.
+_DELETE_OPTS = client.V1DeleteOptions(propagation_policy="Background")
+
+
+def _raw_list_stores() -> Dict[str, Any]:
+    """LIST stores as raw bytes and decode once with orjson.
+
+    Skips kubernetes-client's per-object deserialization walk; callers
+    consume plain dicts anyway.
+    """
+    resp = co_api.api_client.call_api(
+        _STORES_PATH,
+        "GET",
+        auth_settings=["BearerToken"],
+        response_type=None,
+        _return_http_data_only=True,
+        _preload_content=False,
+    )
+    return orjson.loads(resp.data)
+
+
+def _is_active(item: Dict[str, Any]) -> bool:
+    return not item.get("metadata", {}).get("deletionTimestamp")
+
+
+def _item_ip(item: Dict[str, Any]) -> Optional[str]:
+    return ((item.get("spec", {}) or {}).get("requestedBy", {}) or {}).get("ip")
+
+
+class StoreCache:
+    """Watch-backed reflector over Store objects in the platform namespace.
+
+    Keeps an in-memory `{name: item}` map fed by a background watch so read
+    paths avoid a round-trip to the apiserver per request. Seeds with a full
+    LIST, tracks resourceVersion, relists on 410 Gone and every
+    CACHE_RELIST_SECONDS as a self-heal fallback.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._resource_version = ""
+        self._synced = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # name -> (uid, resourceVersion, recorded_at) for writes made by this
+        # process, so read-after-write is not answered from a lagging cache.
+        self._own_writes: Dict[str, tuple] = {}
+        # Quota counters maintained incrementally so enforcement is O(1)
+        # instead of rescanning every item per create.
+        self._active_count = 0
+        self._per_ip_count: Dict[str, int] = {}
+
+    def start(self) -> None:
+        if self._thread:
+            return
+        self._thread = threading.Thread(target=self._run, name="store-cache", daemon=True)
+        self._thread.start()
+
+    def wait_synced(self, timeout: float = CACHE_SYNC_WAIT_SECONDS) -> bool:
+        return self._synced.wait(timeout)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._items.get(name)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._items.values())
+
+    def active_count(self) -> int:
+        with self._lock:
+            return self._active_count
+
+    def active_count_for_ip(self, ip: str) -> int:
+        with self._lock:
+            return self._per_ip_count.get(ip, 0)
+
+    def _set_item_locked(self, name: str, obj: Optional[Dict[str, Any]]) -> None:
+        old = self._items.get(name)
+        if old is not None and _is_active(old):
+            self._active_count -= 1
+            ip = _item_ip(old)
+            if ip:
+                remaining = self._per_ip_count.get(ip, 0) - 1
+                if remaining > 0:
+                    self._per_ip_count[ip] = remaining
+                else:
+                    self._per_ip_count.pop(ip, None)
+        if obj is None:
+            self._items.pop(name, None)
+            return
+        self._items[name] = obj
+        if _is_active(obj):
+            self._active_count += 1
+            ip = _item_ip(obj)
+            if ip:
+                self._per_ip_count[ip] = self._per_ip_count.get(ip, 0) + 1
+
+    def record_own_write(self, obj: Dict[str, Any]) -> None:
+        meta = obj.get("metadata", {})
+        name = meta.get("name")
+        rv = meta.get("resourceVersion")
+        if not name or not rv:
+            return
+        with self._lock:
+            self._own_writes[name] = (meta.get("uid"), int(rv), time.time())
+            # Make the write visible locally before the watch delivers it.
+            self._set_item_locked(name, obj)
+            self._purge_own_writes_locked()
+
+    def _purge_own_writes_locked(self) -> None:
+        cutoff = time.time() - OWN_WRITE_TTL_SECONDS
+        stale = [n for n, (_, _, at) in self._own_writes.items() if at < cutoff]
+        for n in stale:
+            del self._own_writes[n]
+
+    def _observed_own_write(self, name: str) -> bool:
+        with self._lock:
+            entry = self._own_writes.get(name)
+            if not entry:
+                return True
+            uid, rv, recorded_at = entry
+            if time.time() - recorded_at > OWN_WRITE_TTL_SECONDS:
+                del self._own_writes[name]
+                return True
+            item = self._items.get(name)
+            if item:
+                meta = item.get("metadata", {})
+                if meta.get("uid") == uid and int(meta.get("resourceVersion", 0)) >= rv:
+                    return True
+            return False
+
+    def wait_own_write(self, name: str) -> bool:
+        """Wait briefly until the cache has caught up with our own write.
+
+        Returns False if the cache is still behind after the wait, in which
+        case callers should fall back to a direct GET.
+        """
+        deadline = time.monotonic() + OWN_WRITE_WAIT_SECONDS
+        while True:
+            if self._observed_own_write(name):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+
+    def _relist(self) -> None:
+        res = _raw_list_stores()
+        with self._lock:
+            self._items = {}
+            self._active_count = 0
+            self._per_ip_count = {}
+            for it in res.get("items", []):
+                name = it.get("metadata", {}).get("name", "")
+                if name:
+                    self._set_item_locked(name, it)
+            self._resource_version = res.get("metadata", {}).get("resourceVersion", "")
+        self._synced.set()
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        obj = event.get("object") or {}
+        name = obj.get("metadata", {}).get("name")
+        if not name:
+            return
+        with self._lock:
+            self._set_item_locked(name, None if event.get("type") == "DELETED" else obj)
+            rv = obj.get("metadata", {}).get("resourceVersion")
+            if rv:
+                self._resource_version = rv
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._relist()
+                for event in watch.Watch().stream(
+                    co_api.list_namespaced_custom_object,
+                    **_CRD_KW,
+                    resource_version=self._resource_version,
+                    timeout_seconds=CACHE_RELIST_SECONDS,
+                ):
+                    self._apply_event(event)
+            except ApiException as e:
+                # 410 Gone: resourceVersion too old, relist immediately.
+                if e.status != 410:
+                    time.sleep(5)
+            except Exception:
+                time.sleep(5)
+
+
+store_cache = StoreCache()
+store_cache.start()
+
 
 class StoreCreateReq(BaseModel):
     engine: Literal["woocommerce", "medusa"] = "woocommerce"
-    storeId: str = Field(..., min_length=3, max_length=32, pattern=r"^[a-z0-9-]+$")
+    storeId: str = Field(..., min_length=3, max_length=32)
+
+    @field_validator("storeId")
+    @classmethod
+    def _store_id_charset(cls, v: str) -> str:
+        if not _STORE_ID_RE.fullmatch(v):
+            raise ValueError("storeId must match ^[a-z0-9-]+$")
+        return v
 
 
 class StoreEvent(BaseModel):
@@ -71,7 +464,11 @@ class StoreEventsResp(BaseModel):
     events: List[StoreEvent]
 
 
-app = FastAPI(title="Store Platform API", version="0.2.0")
+app = FastAPI(
+    title="Store Platform API",
+    version="0.2.0",
+    default_response_class=ORJSONResponse,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=CORS_ALLOW_ORIGINS or ["*"],
@@ -80,6 +477,213 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+_PREFLIGHT_RESPONSE_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET,POST,DELETE,OPTIONS"),
+    (b"access-control-allow-headers", b"*"),
+    (b"access-control-max-age", b"86400"),
+]
+
+
+class _PreflightFastPath:
+    """Answer wildcard-CORS preflights with a canned response.
+
+    With `*` origins and no credentials the preflight answer is a constant,
+    so send it directly instead of traversing the middleware stack and
+    router; max-age lets browsers cache it for a day.
+    """
+
+    def __init__(self, app_: Any) -> None:
+        self._app = app_
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "OPTIONS"
+            and any(k == b"access-control-request-method" for k, _ in scope["headers"])
+        ):
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": _PREFLIGHT_RESPONSE_HEADERS,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await self._app(scope, receive, send)
+
+
+# Only safe when CORS is effectively "allow everyone".
+if (CORS_ALLOW_ORIGINS or ["*"]) == ["*"]:
+    app.add_middleware(_PreflightFastPath)
+
+
+class _SingleflightCall:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Singleflight:
+    """Coalesce concurrent identical fetches into one in-flight call.
+
+    The first caller for a key performs the fetch; the rest wait on its
+    result, so k concurrent identical reads cost one apiserver call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[Any, _SingleflightCall] = {}
+
+    def run(self, key: Any, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _SingleflightCall()
+                self._inflight[key] = call
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            call.event.set()
+
+
+_fetch_singleflight = _Singleflight()
+
+
+def _cached_json_response(ttl: float) -> Callable:
+    """Cache a GET handler's serialized response for `ttl` seconds.
+
+    Stores (body, etag) per (handler, path-params) key, answers matching
+    If-None-Match with 304, and serves the last good body with a
+    `Warning: 110` header when the backend errors (stale-if-error).
+    """
+    cache: TTLCache = TTLCache(maxsize=256, ttl=ttl)
+    # stale-if-error bodies outlive the primary TTL but stay bounded, so
+    # keys for deleted stores age out instead of leaking for the process
+    # lifetime.
+    stale: TTLCache = TTLCache(maxsize=256, ttl=STALE_RESPONSE_TTL_SECONDS)
+    lock = threading.Lock()
+    # Let polling clients revalidate with If-None-Match instead of refetching
+    # full payloads on every cycle.
+    cache_control = f"private, max-age={max(int(ttl), 1)}, stale-while-revalidate=30"
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(**kwargs: Any) -> Response:
+            request: Request = kwargs["request"]
+            key = (fn.__name__,) + tuple(
+                sorted((k, v) for k, v in kwargs.items() if k != "request")
+            )
+            with lock:
+                entry = cache.get(key)
+            if entry is None:
+                try:
+                    result = fn(**kwargs)
+                except HTTPException as e:
+                    with lock:
+                        stale_entry = stale.get(key) if e.status_code >= 500 else None
+                    if stale_entry is not None:
+                        body, etag = stale_entry
+                        return Response(
+                            content=body,
+                            media_type="application/json",
+                            headers={
+                                "ETag": etag,
+                                "Cache-Control": cache_control,
+                                "Warning": '110 - "Response is Stale"',
+                            },
+                        )
+                    raise
+                if isinstance(result, (dict, list)):
+                    body = orjson.dumps(result)
+                else:
+                    body = json.dumps(
+                        jsonable_encoder(result), separators=(",", ":")
+                    ).encode()
+                etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+                entry = (body, etag)
+                with lock:
+                    cache[key] = entry
+                    stale[key] = entry
+            body, etag = entry
+            if request.headers.get("if-none-match") == etag:
+                return Response(
+                    status_code=304,
+                    headers={"ETag": etag, "Cache-Control": cache_control},
+                )
+            return Response(
+                content=body,
+                media_type="application/json",
+                headers={"ETag": etag, "Cache-Control": cache_control},
+            )
+
+        return wrapper
+
+    return decorator
+
+
+# In-process cap on concurrent writes so bursts shed load with an immediate
+# 503 instead of queue-piling blocking calls into the apiserver. The Redis
+# dependency below extends the same cap across workers when configured.
+_write_semaphore = asyncio.Semaphore(CREATE_CONCURRENCY)
+
+
+async def _limit_write_concurrency() -> AsyncIterator[None]:
+    if _write_semaphore.locked():
+        raise HTTPException(status_code=503, detail="Too many concurrent write requests")
+    await _write_semaphore.acquire()
+    try:
+        yield
+    finally:
+        _write_semaphore.release()
+
+
+def _create_inflight_slot() -> Iterator[None]:
+    """Cross-worker cap on concurrent create requests (Redis only).
+
+    Reuses the sliding-window script with the window acting as a stale-entry
+    expiry so slots held by crashed workers free themselves.
+    """
+    if _window_script is None:
+        yield
+        return
+    req_id = uuid.uuid4().hex
+    key = "stores:create-inflight"
+    try:
+        allowed = bool(
+            _window_script(
+                keys=[key],
+                args=[time.time(), RATE_WINDOW_SECONDS, CREATE_CONCURRENCY, req_id],
+            )
+        )
+    except Exception:
+        allowed = True
+    if not allowed:
+        raise HTTPException(status_code=503, detail="Too many concurrent create requests")
+    try:
+        yield
+    finally:
+        try:
+            _redis_client.zrem(key, req_id)
+        except Exception:
+            pass
+
 
 def _client_ip(request: Request) -> str:
     xff = request.headers.get("x-forwarded-for")
@@ -91,37 +695,89 @@ def _client_ip(request: Request) -> str:
 
 
 def _check_create_rate_limit(ip: str) -> None:
+    allowed = _redis_check_rate_limit(ip)
+    if allowed is not None:
+        if not allowed:
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded for {ip}: {CREATE_RATE_LIMIT} creates/{RATE_WINDOW_SECONDS}s",
+            )
+        return
+
     now = time.time()
-    with _rate_limit_lock:
-        bucket = _ip_create_requests.setdefault(ip, deque())
-        while bucket and (now - bucket[0]) > RATE_WINDOW_SECONDS:
-            bucket.popleft()
-        if len(bucket) >= CREATE_RATE_LIMIT:
+    with _rate_lock_for(ip):
+        if not _rate_state.check(ip, now):
             raise HTTPException(
                 status_code=429,
                 detail=f"Rate limit exceeded for {ip}: {CREATE_RATE_LIMIT} creates/{RATE_WINDOW_SECONDS}s",
             )
-        bucket.append(now)
+
+
+def _api_list_store_objects() -> List[Dict[str, Any]]:
+    def fetch() -> List[Dict[str, Any]]:
+        try:
+            return _raw_list_stores().get("items", [])
+        except ApiException as e:
+            raise HTTPException(status_code=500, detail=f"K8s error: {e.reason}") from e
+
+    return _fetch_singleflight.run("stores:list", fetch)
 
 
 def _list_store_objects() -> List[Dict[str, Any]]:
-    try:
-        res = co_api.list_namespaced_custom_object(
-            group=CRD_GROUP,
-            version=CRD_VERSION,
-            namespace=APP_NAMESPACE,
-            plural=CRD_PLURAL,
-        )
-        return res.get("items", [])
-    except ApiException as e:
-        raise HTTPException(status_code=500, detail=f"K8s error: {e.reason}") from e
+    if store_cache.wait_synced():
+        return store_cache.list()
+    # Watch not (yet) established; fall back to a direct LIST.
+    return _api_list_store_objects()
+
+
+def _status_events(status: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Chronological events from the status ring, or the legacy flat list.
+
+    The operator writes events as a fixed-size ring (eventsTail) plus a
+    lifetime counter (eventsHead); once the ring has wrapped, the oldest
+    entry sits at eventsHead % len.
+    """
+    tail = status.get("eventsTail")
+    if tail:
+        head = int(status.get("eventsHead") or len(tail))
+        if head > len(tail):
+            idx = head % len(tail)
+            return tail[idx:] + tail[:idx]
+        return list(tail)
+    return status.get("events", []) or []
+
+
+def _to_store_resp_dict(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Plain-dict projection of a Store item for the read paths.
+
+    The data comes from our own K8s JSON, so read endpoints skip Pydantic
+    construction entirely; `StoreResp` stays as the documented schema.
+    """
+    spec = item.get("spec", {})
+    status = item.get("status", {}) or {}
+    return {
+        "storeId": spec.get("storeId") or item.get("metadata", {}).get("name", ""),
+        "engine": spec.get("engine", ""),
+        "phase": status.get("phase", "Provisioning"),
+        "url": status.get("url"),
+        "createdAt": status.get("createdAt")
+        or item.get("metadata", {}).get("creationTimestamp"),
+        "updatedAt": status.get("updatedAt"),
+        "lastError": status.get("lastError"),
+        "namespace": status.get("namespace"),
+        "releaseName": status.get("releaseName"),
+        "events": _status_events(status)[:EVENTS_LIMIT],
+    }
 
 
 def _to_store_resp(item: Dict[str, Any]) -> StoreResp:
+    # The item is our own K8s JSON, so skip field validation/coercion.
     spec = item.get("spec", {})
     status = item.get("status", {}) or {}
-    events = status.get("events", [])[:EVENTS_LIMIT]
-    return StoreResp(
+    events = [
+        StoreEvent.model_construct(**evt) for evt in _status_events(status)[:EVENTS_LIMIT]
+    ]
+    return StoreResp.model_construct(
         storeId=spec.get("storeId") or item.get("metadata", {}).get("name", ""),
         engine=spec.get("engine", ""),
         phase=status.get("phase", "Provisioning"),
@@ -135,34 +791,58 @@ def _to_store_resp(item: Dict[str, Any]) -> StoreResp:
     )
 
 
-def _get_store_or_none(store_id: str) -> Optional[Dict[str, Any]]:
+def _api_get_store_or_none(store_id: str) -> Optional[Dict[str, Any]]:
+    def fetch() -> Optional[Dict[str, Any]]:
+        try:
+            return co_api.get_namespaced_custom_object(name=store_id, **_CRD_KW)
+        except ApiException as e:
+            if e.status == 404:
+                return None
+            raise HTTPException(status_code=500, detail=f"K8s error: {e.reason}") from e
+
+    return _fetch_singleflight.run(f"stores:get:{store_id}", fetch)
+
+
+def _created_epoch(ts: Optional[str]) -> float:
+    """RFC3339 timestamp -> epoch seconds; sorts at the end when missing."""
+    if not ts:
+        return 0.0
     try:
-        return co_api.get_namespaced_custom_object(
-            group=CRD_GROUP,
-            version=CRD_VERSION,
-            namespace=APP_NAMESPACE,
-            plural=CRD_PLURAL,
-            name=store_id,
-        )
-    except ApiException as e:
-        if e.status == 404:
-            return None
-        raise HTTPException(status_code=500, detail=f"K8s error: {e.reason}") from e
+        return datetime.fromisoformat(ts.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return 0.0
 
 
-def _enforce_store_quotas(items: List[Dict[str, Any]], caller_ip: str) -> None:
-    active = [it for it in items if not it.get("metadata", {}).get("deletionTimestamp")]
-    if len(active) >= MAX_ACTIVE_STORES:
+def _get_store_or_none(store_id: str) -> Optional[Dict[str, Any]]:
+    if store_cache.wait_synced() and store_cache.wait_own_write(store_id):
+        return store_cache.get(store_id)
+    return _api_get_store_or_none(store_id)
+
+
+def _enforce_store_quotas(caller_ip: str) -> None:
+    if store_cache.wait_synced():
+        active = store_cache.active_count()
+        same_ip = store_cache.active_count_for_ip(caller_ip)
+    else:
+        # Global quota still needs the full list; per-IP counting is filtered
+        # server-side via the requested-ip-hash label instead of a client-side
+        # scan over every item.
+        items = [it for it in _api_list_store_objects() if _is_active(it)]
+        active = len(items)
+        try:
+            res = co_api.list_namespaced_custom_object(
+                label_selector=f"{_IP_HASH_LABEL}={_ip_hash(caller_ip)}",
+                **_CRD_KW,
+            )
+            same_ip = sum(1 for it in res.get("items", []) if _is_active(it))
+        except ApiException:
+            same_ip = sum(1 for it in items if _item_ip(it) == caller_ip)
+
+    if active >= MAX_ACTIVE_STORES:
         raise HTTPException(
             status_code=409,
             detail=f"Global store quota reached ({MAX_ACTIVE_STORES})",
         )
-
-    same_ip = 0
-    for it in active:
-        req_meta = (it.get("spec", {}) or {}).get("requestedBy", {}) or {}
-        if req_meta.get("ip") == caller_ip:
-            same_ip += 1
     if same_ip >= MAX_STORES_PER_IP:
         raise HTTPException(
             status_code=409,
@@ -171,16 +851,29 @@ def _enforce_store_quotas(items: List[Dict[str, Any]], caller_ip: str) -> None:
 
 
 @app.get("/healthz")
-def healthz() -> Dict[str, bool]:
+async def healthz() -> Dict[str, bool]:
     return {"ok": True}
 
 
-@app.post("/stores", response_model=StoreResp)
-def create_store(req: StoreCreateReq, request: Request) -> StoreResp:
+@app.post(
+    "/stores",
+    response_model=StoreResp,
+    dependencies=[Depends(_limit_write_concurrency), Depends(_create_inflight_slot)],
+)
+async def create_store(req: StoreCreateReq, request: Request) -> StoreResp:
     caller_ip = _client_ip(request)
     _check_create_rate_limit(caller_ip)
 
-    existing = _get_store_or_none(req.storeId)
+    # Both pre-checks may fall back to blocking apiserver calls; run them in
+    # the threadpool concurrently. The quota result is only consulted when the
+    # store does not already exist (idempotent re-POSTs bypass quotas).
+    existing, quota_err = await asyncio.gather(
+        to_thread.run_sync(_get_store_or_none, req.storeId),
+        to_thread.run_sync(_enforce_store_quotas, caller_ip),
+        return_exceptions=True,
+    )
+    if isinstance(existing, BaseException):
+        raise existing
     if existing:
         existing_engine = (existing.get("spec", {}) or {}).get("engine")
         if existing_engine != req.engine:
@@ -189,16 +882,16 @@ def create_store(req: StoreCreateReq, request: Request) -> StoreResp:
                 detail=f"StoreId '{req.storeId}' already exists with engine '{existing_engine}'",
             )
         return _to_store_resp(existing)
+    if isinstance(quota_err, BaseException):
+        raise quota_err
 
-    items = _list_store_objects()
-    _enforce_store_quotas(items, caller_ip)
-
-    body: Dict[str, Any] = {
-        "apiVersion": f"{CRD_GROUP}/{CRD_VERSION}",
+    body = {
+        "apiVersion": _API_VERSION,
         "kind": "Store",
         "metadata": {
             "name": req.storeId,
             "namespace": APP_NAMESPACE,
+            "labels": {_IP_HASH_LABEL: _ip_hash(caller_ip)},
         },
         "spec": {
             "engine": req.engine,
@@ -211,17 +904,16 @@ def create_store(req: StoreCreateReq, request: Request) -> StoreResp:
     }
 
     try:
-        obj = co_api.create_namespaced_custom_object(
-            group=CRD_GROUP,
-            version=CRD_VERSION,
-            namespace=APP_NAMESPACE,
-            plural=CRD_PLURAL,
-            body=body,
+        obj = await to_thread.run_sync(
+            functools.partial(co_api.create_namespaced_custom_object, body=body, **_CRD_KW)
         )
+        store_cache.record_own_write(obj)
         return _to_store_resp(obj)
     except ApiException as e:
         if e.status == 409:
-            existing_after_race = _get_store_or_none(req.storeId)
+            # The conflicting object was just created elsewhere, so the watch
+            # cache may not have it yet; ask the apiserver directly.
+            existing_after_race = await to_thread.run_sync(_api_get_store_or_none, req.storeId)
             if existing_after_race:
                 existing_engine = (existing_after_race.get("spec", {}) or {}).get("engine")
                 if existing_engine != req.engine:
@@ -234,41 +926,47 @@ def create_store(req: StoreCreateReq, request: Request) -> StoreResp:
         raise HTTPException(status_code=500, detail=f"K8s error: {e.reason}") from e
 
 
-@app.get("/stores", response_model=List[StoreResp])
-def list_stores() -> List[StoreResp]:
+@app.get("/stores", response_model=None, responses={200: {"model": List[StoreResp]}})
+@_cached_json_response(LIST_RESPONSE_TTL_SECONDS)
+def list_stores(request: Request) -> List[Dict[str, Any]]:
     items = _list_store_objects()
-    stores = [_to_store_resp(it) for it in items]
-    stores.sort(key=lambda s: s.createdAt or "", reverse=True)
+    stores = [_to_store_resp_dict(it) for it in items]
+    stores.sort(key=lambda s: _created_epoch(s.get("createdAt")), reverse=True)
     return stores
 
 
-@app.get("/stores/{store_id}", response_model=StoreResp)
-def get_store(store_id: str) -> StoreResp:
+@app.get("/stores/{store_id}", response_model=None, responses={200: {"model": StoreResp}})
+@_cached_json_response(STORE_RESPONSE_TTL_SECONDS)
+def get_store(store_id: str, request: Request) -> Dict[str, Any]:
     obj = _get_store_or_none(store_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Not found")
-    return _to_store_resp(obj)
+    return _to_store_resp_dict(obj)
 
 
-@app.get("/stores/{store_id}/events", response_model=StoreEventsResp)
-def get_store_events(store_id: str) -> StoreEventsResp:
+@app.get(
+    "/stores/{store_id}/events",
+    response_model=None,
+    responses={200: {"model": StoreEventsResp}},
+)
+@_cached_json_response(STORE_RESPONSE_TTL_SECONDS)
+def get_store_events(store_id: str, request: Request) -> Dict[str, Any]:
     obj = _get_store_or_none(store_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Not found")
-    resp = _to_store_resp(obj)
-    return StoreEventsResp(storeId=store_id, events=resp.events)
+    return {"storeId": store_id, "events": _to_store_resp_dict(obj)["events"]}
 
 
-@app.delete("/stores/{store_id}")
-def delete_store(store_id: str) -> Dict[str, Any]:
+@app.delete("/stores/{store_id}", dependencies=[Depends(_limit_write_concurrency)])
+async def delete_store(store_id: str) -> Dict[str, Any]:
     try:
-        co_api.delete_namespaced_custom_object(
-            group=CRD_GROUP,
-            version=CRD_VERSION,
-            namespace=APP_NAMESPACE,
-            plural=CRD_PLURAL,
-            name=store_id,
-            body=client.V1DeleteOptions(),
+        await to_thread.run_sync(
+            functools.partial(
+                co_api.delete_namespaced_custom_object,
+                name=store_id,
+                body=_DELETE_OPTS,
+                **_CRD_KW,
+            )
         )
         return {"deleted": True, "storeId": store_id}
     except ApiException as e:
@@ -1,15 +1,22 @@
+import asyncio
 import base64
+import logging
 import os
 import secrets
 import string
-import subprocess
+import tempfile
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import kopf
-from kubernetes import client, config
+import yaml
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
 PLATFORM_NAMESPACE = os.getenv("PLATFORM_NAMESPACE", "store-platform")
@@ -23,6 +30,13 @@ MAX_PROVISION_SECONDS = int(os.getenv("MAX_PROVISION_SECONDS", "900"))
 MAX_CONCURRENT_PROVISIONS = int(os.getenv("MAX_CONCURRENT_PROVISIONS", "2"))
 MAX_STATUS_EVENTS = int(os.getenv("MAX_STATUS_EVENTS", "20"))
 OPERATOR_WORKERS = int(os.getenv("OPERATOR_WORKERS", "4"))
+WATCH_RELIST_SECONDS = int(os.getenv("WATCH_RELIST_SECONDS", "300"))
+WATCH_SYNC_WAIT_SECONDS = float(os.getenv("WATCH_SYNC_WAIT_SECONDS", "2"))
+
+# Number of pre-provisioned namespaces (with the release already running) to
+# keep on standby; 0 disables the warm pool.
+STORE_WARM_POOL = int(os.getenv("STORE_WARM_POOL", "0"))
+STORE_WARM_POOL_INTERVAL = int(os.getenv("STORE_WARM_POOL_INTERVAL", "30"))
 
 HELM_BIN = os.getenv("HELM_BIN", "helm")
 CHART_WOOCOMMERCE = os.getenv("CHART_WOOCOMMERCE", "/charts/woocommerce")
@@ -35,9 +49,17 @@ CRD_PLURAL = os.getenv("STORE_CRD_PLURAL", "stores")
 FINALIZER = "stores.urumi.ai/finalizer"
 STORE_MANAGED_LABEL = "urumi.ai/managed-store"
 STORE_ID_LABEL = "urumi.ai/storeId"
+WARM_POOL_LABEL = "urumi.ai/warm-pool"
+WARM_RELEASE_ANNOTATION = "urumi.ai/releaseName"
 ADMIN_SECRET_NAME = os.getenv("STORE_ADMIN_SECRET_NAME", "store-admin")
 
-_provision_semaphore = threading.BoundedSemaphore(MAX_CONCURRENT_PROVISIONS)
+# Provisioning work queue: a fixed pool of MAX_CONCURRENT_PROVISIONS worker
+# tasks executes reconciles. Handlers enqueue a job and await its future, so
+# nothing sits parked holding a slot, and a job whose Store generation has
+# already been superseded in the informer cache is skipped without doing any
+# work (the newer event carries its own job).
+_provision_queue: Optional["asyncio.Queue"] = None
+_provision_workers: List["asyncio.Task"] = []
 
 
 def now_iso() -> str:
@@ -52,9 +74,126 @@ def _load_kube() -> None:
 
 
 _load_kube()
-core = client.CoreV1Api()
-co = client.CustomObjectsApi()
-net = client.NetworkingV1Api()
+# One shared ApiClient so every API group reuses the same keep-alive
+# connection pool; sized so kopf's worker threads don't contend for sockets.
+_k8s_cfg = client.Configuration.get_default_copy()
+_k8s_cfg.connection_pool_maxsize = max(32, OPERATOR_WORKERS * 4)
+_api_client = client.ApiClient(_k8s_cfg)
+core = client.CoreV1Api(_api_client)
+co = client.CustomObjectsApi(_api_client)
+net = client.NetworkingV1Api(_api_client)
+
+# Watches hold a connection open for the life of the stream; give them a
+# separate pool so long-lived watch sockets can't exhaust the shared client
+# and stall unrelated GET/PATCH traffic.
+_watch_cfg = client.Configuration.get_default_copy()
+_watch_cfg.connection_pool_maxsize = 8
+_watch_api_client = client.ApiClient(_watch_cfg)
+watch_core = client.CoreV1Api(_watch_api_client)
+watch_co = client.CustomObjectsApi(_watch_api_client)
+watch_apps = client.AppsV1Api(_watch_api_client)
+
+# (connect, read) timeout for watch streams: fail fast on connect, allow
+# the stream itself to idle up to an hour.
+_WATCH_REQUEST_TIMEOUT = (5, 3600)
+
+
+class _WatchCache:
+    """In-memory reflector over one list+watch source, keyed by name.
+
+    Seeds with a LIST, follows the watch with resourceVersion bookkeeping
+    (relisting on 410 Gone and every WATCH_RELIST_SECONDS as a self-heal),
+    and stores raw dict objects so readers avoid live GETs on the hot path.
+    """
+
+    def __init__(self, label: str, list_fn, **list_kwargs) -> None:
+        self._label = label
+        self._list_fn = list_fn
+        self._list_kwargs = list_kwargs
+        self._lock = threading.Lock()
+        self._items: Dict[str, Dict] = {}
+        self._resource_version = ""
+        self._synced = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name=f"watch-cache-{self._label}", daemon=True
+        )
+        self._thread.start()
+
+    def wait_synced(self, timeout: float = WATCH_SYNC_WAIT_SECONDS) -> bool:
+        return self._synced.wait(timeout)
+
+    def get(self, name: str) -> Optional[Dict]:
+        with self._lock:
+            return self._items.get(name)
+
+    def values(self) -> List[Dict]:
+        with self._lock:
+            return list(self._items.values())
+
+    def _relist(self) -> None:
+        res = self._list_fn(**self._list_kwargs)
+        if not isinstance(res, dict):
+            # Typed client lists (e.g. V1NamespaceList) -> raw-shaped dicts.
+            res = co.api_client.sanitize_for_serialization(res)
+        with self._lock:
+            self._items = {
+                it.get("metadata", {}).get("name", ""): it for it in res.get("items", [])
+            }
+            self._resource_version = (res.get("metadata", {}) or {}).get("resourceVersion", "")
+        self._synced.set()
+
+    def _apply_event(self, event: Dict) -> None:
+        obj = event.get("raw_object") or {}
+        name = obj.get("metadata", {}).get("name")
+        if not name:
+            return
+        with self._lock:
+            if event.get("type") == "DELETED":
+                self._items.pop(name, None)
+            else:
+                self._items[name] = obj
+            rv = obj.get("metadata", {}).get("resourceVersion")
+            if rv:
+                self._resource_version = rv
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._relist()
+                for event in watch.Watch().stream(
+                    self._list_fn,
+                    **self._list_kwargs,
+                    resource_version=self._resource_version,
+                    timeout_seconds=WATCH_RELIST_SECONDS,
+                    _request_timeout=_WATCH_REQUEST_TIMEOUT,
+                ):
+                    self._apply_event(event)
+            except ApiException as e:
+                # 410 Gone: resourceVersion too old, relist immediately.
+                if e.status != 410:
+                    time.sleep(5)
+            except Exception:
+                time.sleep(5)
+
+
+store_watch_cache = _WatchCache(
+    "stores",
+    watch_co.list_namespaced_custom_object,
+    group=CRD_GROUP,
+    version=CRD_VERSION,
+    namespace=PLATFORM_NAMESPACE,
+    plural=CRD_PLURAL,
+)
+ns_watch_cache = _WatchCache(
+    "namespaces",
+    watch_core.list_namespace,
+    label_selector=f"{STORE_MANAGED_LABEL}=true",
+)
 
 
 @dataclass(frozen=True)
@@ -65,57 +204,50 @@ class EngineHandler:
     def build_release_name(self, store_id: str) -> str:
         return f"{self.name}-{store_id}"
 
-    def build_helm_args(
+    @cached_property
+    def values_template(self) -> Dict:
+        """Static portion of this engine's helm values, built once per handler."""
+        if self.name == "woocommerce":
+            # Bitnami WordPress chart values
+            wordpress: Dict = {
+                "ingress": {"enabled": True, "ingressClassName": INGRESS_CLASS},
+                "service": {"type": "ClusterIP"},
+                "wordpressPlugins": "woocommerce",
+            }
+            if STORAGE_CLASS:
+                wordpress["persistence"] = {"storageClass": STORAGE_CLASS}
+                wordpress["mariadb"] = {
+                    "primary": {"persistence": {"storageClass": STORAGE_CLASS}}
+                }
+            return {"wordpress": wordpress}
+
+        # Medusa stub path (Round 1)
+        return {"ingress": {"className": INGRESS_CLASS}}
+
+    def build_helm_values(
         self,
         store_id: str,
-        namespace: str,
         host: str,
         admin_user: str,
         admin_password: str,
-    ) -> List[str]:
-        timeout = f"--timeout={MAX_PROVISION_SECONDS}s"
+    ) -> Dict:
+        template = self.values_template
         if self.name == "woocommerce":
-            args = [
-                "upgrade",
-                "--install",
-                self.build_release_name(store_id),
-                self.chart_path,
-                "-n",
-                namespace,
-                "--wait",
-                timeout,
-                # Bitnami WordPress chart values
-                "--set",
-                "wordpress.ingress.enabled=true",
-                "--set-string",
-                f"wordpress.ingress.ingressClassName={INGRESS_CLASS}",
-                "--set-string",
-                f"wordpress.ingress.hostname={host}",
-                "--set-string",
-                "wordpress.service.type=ClusterIP",
-                "--set-string",
-                f"wordpress.wordpressUsername={admin_user}",
-                "--set-string",
-                f"wordpress.wordpressPassword={admin_password}",
-                "--set-string",
-                f"wordpress.wordpressEmail=admin@{host}",
-                "--set-string",
-                f"wordpress.wordpressBlogName={store_id}",
-                "--set-string",
-                "wordpress.wordpressPlugins=woocommerce",
-            ]
-            if STORAGE_CLASS:
-                args.extend(
-                    [
-                        "--set-string",
-                        f"wordpress.persistence.storageClass={STORAGE_CLASS}",
-                        "--set-string",
-                        f"wordpress.mariadb.primary.persistence.storageClass={STORAGE_CLASS}",
-                    ]
-                )
-            return args
-
-        # Medusa stub path (Round 1)
+            wordpress: Dict = dict(template["wordpress"])
+            wordpress["ingress"] = {**wordpress["ingress"], "hostname": host}
+            wordpress.update(
+                {
+                    "wordpressUsername": admin_user,
+                    "wordpressPassword": admin_password,
+                    "wordpressEmail": f"admin@{host}",
+                    "wordpressBlogName": store_id,
+                }
+            )
+            return {"wordpress": wordpress}
+
+        return {"ingress": {**template["ingress"], "hostname": host}}
+
+    def build_helm_args(self, store_id: str, namespace: str, values_file: str) -> List[str]:
         return [
             "upgrade",
             "--install",
@@ -123,12 +255,8 @@ class EngineHandler:
             self.chart_path,
             "-n",
             namespace,
-            "--wait",
-            timeout,
-            "--set-string",
-            f"ingress.className={INGRESS_CLASS}",
-            "--set-string",
-            f"ingress.hostname={host}",
+            "-f",
+            values_file,
         ]
 
     def post_ready_checks(self, store_id: str, namespace: str) -> None:
@@ -142,38 +270,151 @@ ENGINE_HANDLERS: Dict[str, EngineHandler] = {
 }
 
 
-def run_helm(args: List[str], timeout: Optional[int] = None) -> str:
+_helm_log = logging.getLogger("helm")
+HELM_LOG_TAIL_LINES = int(os.getenv("HELM_LOG_TAIL_LINES", "200"))
+
+
+async def run_helm(args: List[str], timeout: Optional[int] = None) -> str:
+    """Run helm, streaming its output to the log as it is produced.
+
+    Output is consumed line-by-line (stderr merged into stdout) so long
+    installs show live progress and memory stays bounded; only a short tail
+    is kept for the error message.
+    """
     cmd = [HELM_BIN] + args
-    proc = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=timeout or (MAX_PROVISION_SECONDS + 60),
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
     )
+    tail: deque = deque(maxlen=HELM_LOG_TAIL_LINES)
+
+    async def _pump() -> None:
+        while True:
+            line = await proc.stdout.readline()
+            if not line:
+                return
+            text = line.decode(errors="replace").rstrip()
+            if text:
+                _helm_log.info(text)
+                tail.append(text)
+
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(_pump(), proc.wait()),
+            timeout=timeout or (MAX_PROVISION_SECONDS + 60),
+        )
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise RuntimeError(f"helm timed out: {' '.join(cmd[:3])}")
     if proc.returncode != 0:
-        details = proc.stderr.strip() or proc.stdout.strip() or "unknown error"
+        details = "\n".join(tail) or "unknown error"
         raise RuntimeError(f"helm failed: {details}")
-    return proc.stdout.strip()
+    return "\n".join(tail)
 
 
+async def run_helm_install(
+    handler: EngineHandler,
+    store_id: str,
+    namespace: str,
+    values: Dict,
+    timeout: Optional[int] = None,
+) -> str:
+    """Install/upgrade a release with values passed as a file, not flags.
+
+    Values such as the admin password never touch the argv (visible in
+    /proc and process listings), and the chart sees typed YAML instead of
+    stringly --set flags.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml", prefix="store-values-") as vf:
+        yaml.safe_dump(values, vf)
+        vf.flush()
+        args = handler.build_helm_args(
+            store_id=store_id, namespace=namespace, values_file=vf.name
+        )
+        return await run_helm(args, timeout=timeout)
+
+
+def wait_release_ready(release: str, namespace: str, timeout: int) -> None:
+    """Block until every Deployment of the release reports ready replicas.
+
+    Helm previously did this internally via --wait with polling; watching
+    deployment events returns as soon as readiness flips and frees the
+    provisioning slot sooner.
+    """
+    deadline = time.monotonic() + timeout
+    selector = f"app.kubernetes.io/instance={release}"
+    ready: Dict[str, bool] = {}
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(f"Timed out waiting for release {release} to become ready")
+        try:
+            for event in watch.Watch().stream(
+                watch_apps.list_namespaced_deployment,
+                namespace=namespace,
+                label_selector=selector,
+                timeout_seconds=int(min(remaining, 60)) + 1,
+                _request_timeout=_WATCH_REQUEST_TIMEOUT,
+            ):
+                dep = event.get("object")
+                if dep is None or dep.metadata is None:
+                    continue
+                if event.get("type") == "DELETED":
+                    ready.pop(dep.metadata.name, None)
+                    continue
+                desired = (dep.spec.replicas if dep.spec else None) or 1
+                actual = (dep.status.ready_replicas if dep.status else None) or 0
+                ready[dep.metadata.name] = actual >= desired
+                if ready and all(ready.values()):
+                    return
+        except ApiException as e:
+            if e.status != 410:
+                raise
+
+
+# Pure functions of store_id (the env-derived parts are fixed at import),
+# called several times per reconcile; memoized so repeat calls return the
+# same interned string.
+@lru_cache(maxsize=4096)
 def store_namespace(store_id: str) -> str:
     return f"{STORE_NS_PREFIX}{store_id}"
 
 
+@lru_cache(maxsize=4096)
 def store_host(store_id: str) -> str:
     return f"{store_id}.{BASE_DOMAIN}"
 
 
+@lru_cache(maxsize=4096)
 def store_url(store_id: str) -> str:
     return f"{URL_SCHEME}://{store_host(store_id)}"
 
 
+_ALPHABET_BYTES = (string.ascii_letters + string.digits).encode()
+
+
 def rand_password(n: int = 20) -> str:
-    alphabet = string.ascii_letters + string.digits
-    return "".join(secrets.choice(alphabet) for _ in range(n))
+    # Rejection-sample random bytes against the 62-char alphabet (248 is the
+    # largest multiple of 62 <= 256, so the modulo stays unbiased); one
+    # token_bytes draw usually covers the whole password.
+    out = bytearray()
+    while len(out) < n:
+        for b in secrets.token_bytes(n * 2):
+            if b < 248:
+                out.append(_ALPHABET_BYTES[b % 62])
+                if len(out) == n:
+                    break
+    return out.decode()
 
 
 def get_store(name: str) -> Dict:
+    if store_watch_cache.wait_synced():
+        obj = store_watch_cache.get(name)
+        if obj is not None:
+            return obj
+    # Cache miss: resolve against the apiserver (raises 404 like before).
     return co.get_namespaced_custom_object(
         group=CRD_GROUP,
         version=CRD_VERSION,
@@ -183,9 +424,64 @@ def get_store(name: str) -> Dict:
     )
 
 
+# Last status written or observed per store, fed from patch responses so a
+# status update is a single merge-PATCH instead of a GET+PATCH round trip.
+# The operator is the only status writer, so this view stays authoritative.
+_status_cache_lock = threading.Lock()
+_status_cache: Dict[str, Dict] = {}
+
+
+def _load_status(name: str) -> Dict:
+    with _status_cache_lock:
+        cached = _status_cache.get(name)
+        if cached is not None:
+            return dict(cached)
+    try:
+        obj = get_store(name)
+    except ApiException as e:
+        if e.status == 404:
+            return {}
+        raise
+    return dict(obj.get("status", {}) or {})
+
+
+def _ring_append(current: Dict, new_events: List[Dict]) -> None:
+    """Append events to the status ring (eventsTail + eventsHead counter).
+
+    The tail grows until MAX_STATUS_EVENTS and then wraps in place, so a
+    status write never re-slices the whole list and eventsHead keeps the
+    lifetime event count. A legacy flat events list is absorbed into the
+    ring on first write and deleted server-side in the same patch (merge
+    patch removes keys set to null); otherwise it would survive in etcd
+    and be re-absorbed on every write, clobbering the ring.
+    """
+    legacy = current.pop("events", None)
+    if legacy:
+        tail = list(legacy)[-MAX_STATUS_EVENTS:]
+        head = len(tail)
+    else:
+        tail = list(current.get("eventsTail", []) or [])
+        head = int(current.get("eventsHead") or len(tail))
+    for evt in new_events:
+        if len(tail) < MAX_STATUS_EVENTS:
+            tail.append(evt)
+        else:
+            tail[head % MAX_STATUS_EVENTS] = evt
+        head += 1
+    current["eventsTail"] = tail
+    current["eventsHead"] = head
+    if legacy is not None:
+        current["events"] = None
+
+
+def _forget_status(name: str) -> None:
+    with _status_cache_lock:
+        _status_cache.pop(name, None)
+
+
 def _safe_patch_store_status(name: str, status: Dict) -> None:
     try:
-        co.patch_namespaced_custom_object_status(
+        obj = co.patch_namespaced_custom_object_status(
             group=CRD_GROUP,
             version=CRD_VERSION,
             namespace=PLATFORM_NAMESPACE,
@@ -195,8 +491,11 @@ def _safe_patch_store_status(name: str, status: Dict) -> None:
         )
     except ApiException as e:
         if e.status == 404:
+            _forget_status(name)
             return
         raise
+    with _status_cache_lock:
+        _status_cache[name] = dict(obj.get("status", {}) or {})
 
 
 def patch_store_status(
@@ -208,8 +507,7 @@ def patch_store_status(
     set_fields: Optional[Dict] = None,
     drop_fields: Optional[List[str]] = None,
 ) -> None:
-    obj = get_store(name)
-    current = obj.get("status", {}) or {}
+    current = _load_status(name)
 
     if phase:
         current["phase"] = phase
@@ -225,60 +523,173 @@ def patch_store_status(
         for field_name in drop_fields:
             current.pop(field_name, None)
 
+    # One timestamp per patch: cheaper, and createdAt/updatedAt/event times
+    # can never disagree by microseconds within a single write.
+    ts = now_iso()
     if "createdAt" not in current:
-        current["createdAt"] = now_iso()
-    current["updatedAt"] = now_iso()
+        current["createdAt"] = ts
+    current["updatedAt"] = ts
 
-    events = current.get("events", []) or []
-    if event_type:
-        events.append(
-            {
-                "type": event_type,
-                "message": event_message or "",
-                "timestamp": now_iso(),
-            }
-        )
-        events = events[-MAX_STATUS_EVENTS:]
-    current["events"] = events
+    new_events = (
+        [{"type": event_type, "message": event_message or "", "timestamp": ts}]
+        if event_type
+        else []
+    )
+    _ring_append(current, new_events)
 
     _safe_patch_store_status(name, current)
 
 
-def add_finalizer(name: str) -> None:
-    obj = get_store(name)
-    finalizers = obj.get("metadata", {}).get("finalizers", []) or []
-    if FINALIZER in finalizers:
-        return
-    finalizers.append(FINALIZER)
-    co.patch_namespaced_custom_object(
-        CRD_GROUP,
-        CRD_VERSION,
-        PLATFORM_NAMESPACE,
-        CRD_PLURAL,
-        name,
-        {"metadata": {"finalizers": finalizers}},
+class StatusAccumulator:
+    """Buffers status mutations and writes them as one merge-PATCH.
+
+    reconcile_store used to patch the status subresource once per step;
+    accumulating and flushing at milestones (start, pre-helm, ready, failure)
+    keeps the event timeline while cutting status writes per reconcile.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._reset()
+
+    def _reset(self) -> None:
+        self._phase: Optional[str] = None
+        self._events: List[Dict] = []
+        self._set: Dict = {}
+        self._drop: List[str] = []
+
+    def set_phase(self, phase: str) -> "StatusAccumulator":
+        self._phase = phase
+        return self
+
+    def add_event(self, event_type: str, message: str) -> "StatusAccumulator":
+        self._events.append(
+            {"type": event_type, "message": message, "timestamp": now_iso()}
+        )
+        return self
+
+    def set_fields(self, fields: Dict) -> "StatusAccumulator":
+        self._set.update(fields)
+        return self
+
+    def drop_fields(self, *field_names: str) -> "StatusAccumulator":
+        self._drop.extend(field_names)
+        return self
+
+    def flush(self) -> None:
+        if not (self._phase or self._events or self._set or self._drop):
+            return
+        current = _load_status(self._name)
+
+        if self._phase:
+            current["phase"] = self._phase
+        for key, value in self._set.items():
+            if value is None:
+                current.pop(key, None)
+            else:
+                current[key] = value
+        for field_name in self._drop:
+            current.pop(field_name, None)
+
+        ts = now_iso()
+        if "createdAt" not in current:
+            current["createdAt"] = ts
+        current["updatedAt"] = ts
+
+        _ring_append(current, self._events)
+
+        _safe_patch_store_status(self._name, current)
+        self._reset()
+
+
+def _get_store_fresh(name: str) -> Dict:
+    return co.get_namespaced_custom_object(
+        group=CRD_GROUP,
+        version=CRD_VERSION,
+        namespace=PLATFORM_NAMESPACE,
+        plural=CRD_PLURAL,
+        name=name,
+    )
+
+
+def _patch_finalizers(name: str, patch: List[Dict]) -> None:
+    # The generated patch_namespaced_custom_object always sends a merge
+    # patch, which cannot carry JSON-Patch ops; go through call_api with the
+    # explicit content type (same pattern as _ssa).
+    co.api_client.call_api(
+        f"/apis/{CRD_GROUP}/{CRD_VERSION}/namespaces/{PLATFORM_NAMESPACE}"
+        f"/{CRD_PLURAL}/{name}",
+        "PATCH",
+        body=patch,
+        header_params={
+            "Content-Type": "application/json-patch+json",
+            "Accept": "application/json",
+        },
+        auth_settings=["BearerToken"],
+        response_type=None,
+        _return_http_data_only=True,
     )
 
 
+def add_finalizer(name: str) -> None:
+    # First attempt works off the informer cache (no GET); a JSON-Patch
+    # "test" guards against a concurrent writer, and one retry with a fresh
+    # GET covers the cache being behind.
+    for attempt in (0, 1):
+        obj = get_store(name) if attempt == 0 else _get_store_fresh(name)
+        finalizers = obj.get("metadata", {}).get("finalizers", []) or []
+        if FINALIZER in finalizers:
+            return
+        if finalizers:
+            patch = [
+                {"op": "test", "path": "/metadata/finalizers", "value": finalizers},
+                {
+                    "op": "replace",
+                    "path": "/metadata/finalizers",
+                    "value": finalizers + [FINALIZER],
+                },
+            ]
+        else:
+            patch = [
+                {"op": "add", "path": "/metadata/finalizers", "value": [FINALIZER]}
+            ]
+        try:
+            _patch_finalizers(name, patch)
+            return
+        except ApiException as e:
+            if e.status in (409, 422) and attempt == 0:
+                continue
+            raise
+
+
 def remove_finalizer(name: str) -> None:
-    try:
-        obj = get_store(name)
-    except ApiException as e:
-        if e.status == 404:
+    for attempt in (0, 1):
+        try:
+            obj = get_store(name) if attempt == 0 else _get_store_fresh(name)
+        except ApiException as e:
+            if e.status == 404:
+                return
+            raise
+        finalizers = obj.get("metadata", {}).get("finalizers", []) or []
+        if FINALIZER not in finalizers:
             return
-        raise
-    finalizers = obj.get("metadata", {}).get("finalizers", []) or []
-    if FINALIZER not in finalizers:
-        return
-    finalizers = [f for f in finalizers if f != FINALIZER]
-    co.patch_namespaced_custom_object(
-        CRD_GROUP,
-        CRD_VERSION,
-        PLATFORM_NAMESPACE,
-        CRD_PLURAL,
-        name,
-        {"metadata": {"finalizers": finalizers}},
-    )
+        patch = [
+            {"op": "test", "path": "/metadata/finalizers", "value": finalizers},
+            {
+                "op": "replace",
+                "path": "/metadata/finalizers",
+                "value": [f for f in finalizers if f != FINALIZER],
+            },
+        ]
+        try:
+            _patch_finalizers(name, patch)
+            return
+        except ApiException as e:
+            if e.status == 404:
+                return
+            if e.status in (409, 422) and attempt == 0:
+                continue
+            raise
 
 
 def ensure_namespace(ns: str, store_id: str) -> None:
@@ -299,195 +710,215 @@ def ensure_namespace(ns: str, store_id: str) -> None:
     core.create_namespace(body)
 
 
+FIELD_MANAGER = "store-operator"
+
+
+def _ssa(path: str, body: Dict) -> None:
+    """Server-side apply: one idempotent PATCH instead of create->409->patch."""
+    co.api_client.call_api(
+        path,
+        "PATCH",
+        body=body,
+        query_params=[("fieldManager", FIELD_MANAGER), ("force", "true")],
+        header_params={
+            "Content-Type": "application/apply-patch+yaml",
+            "Accept": "application/json",
+        },
+        auth_settings=["BearerToken"],
+        response_type=None,
+        _return_http_data_only=True,
+    )
+
+
+# The specs below are identical for every store; build them once and let the
+# apply functions wrap them with per-namespace metadata. SSA bodies are sent
+# as-is, so the constants are never mutated.
+_RQ_SPEC: Dict = {
+    "hard": {
+        "pods": "10",
+        "requests.cpu": "2",
+        "requests.memory": "2Gi",
+        "limits.cpu": "4",
+        "limits.memory": "4Gi",
+        "persistentvolumeclaims": "5",
+        "requests.storage": "20Gi",
+    }
+}
+
+_LR_SPEC: Dict = {
+    "limits": [
+        {
+            "type": "Container",
+            "default": {"cpu": "500m", "memory": "512Mi"},
+            "defaultRequest": {"cpu": "200m", "memory": "256Mi"},
+        }
+    ]
+}
+
+_NP_DENY_SPEC: Dict = {
+    "podSelector": {"matchLabels": {}},
+    "policyTypes": ["Ingress", "Egress"],
+}
+
+_NP_ALLOW_SPEC: Dict = {
+    "podSelector": {"matchLabels": {}},
+    "policyTypes": ["Ingress", "Egress"],
+    "ingress": [
+        {
+            "from": [
+                {
+                    "namespaceSelector": {
+                        "matchLabels": {"kubernetes.io/metadata.name": "ingress-nginx"}
+                    }
+                },
+                {"podSelector": {"matchLabels": {}}},
+            ]
+        }
+    ],
+    "egress": [
+        # intra-namespace app/db traffic
+        {"to": [{"podSelector": {"matchLabels": {}}}]},
+        # dns
+        {
+            "to": [
+                {
+                    "namespaceSelector": {
+                        "matchLabels": {"kubernetes.io/metadata.name": "kube-system"}
+                    }
+                }
+            ],
+            "ports": [
+                {"protocol": "UDP", "port": 53},
+                {"protocol": "TCP", "port": 53},
+            ],
+        },
+        # external https/http for package/plugin installs and upstream calls
+        {
+            "to": [{"ipBlock": {"cidr": "0.0.0.0/0"}}],
+            "ports": [
+                {"protocol": "TCP", "port": 443},
+                {"protocol": "TCP", "port": 80},
+            ],
+        },
+    ],
+}
+
+
 def apply_resourcequota(ns: str) -> None:
-    rq = client.V1ResourceQuota(
-        metadata=client.V1ObjectMeta(name="store-quota", namespace=ns),
-        spec=client.V1ResourceQuotaSpec(
-            hard={
-                "pods": "10",
-                "requests.cpu": "2",
-                "requests.memory": "2Gi",
-                "limits.cpu": "4",
-                "limits.memory": "4Gi",
-                "persistentvolumeclaims": "5",
-                "requests.storage": "20Gi",
-            }
-        ),
+    _ssa(
+        f"/api/v1/namespaces/{ns}/resourcequotas/store-quota",
+        {
+            "apiVersion": "v1",
+            "kind": "ResourceQuota",
+            "metadata": {"name": "store-quota", "namespace": ns},
+            "spec": _RQ_SPEC,
+        },
     )
-    try:
-        core.create_namespaced_resource_quota(ns, rq)
-    except ApiException as e:
-        if e.status != 409:
-            raise
-        core.patch_namespaced_resource_quota(
-            name="store-quota",
-            namespace=ns,
-            body={"spec": {"hard": rq.spec.hard}},
-        )
 
 
 def apply_limitrange(ns: str) -> None:
-    lr = client.V1LimitRange(
-        metadata=client.V1ObjectMeta(name="store-limits", namespace=ns),
-        spec=client.V1LimitRangeSpec(
-            limits=[
-                client.V1LimitRangeItem(
-                    type="Container",
-                    default={"cpu": "500m", "memory": "512Mi"},
-                    default_request={"cpu": "200m", "memory": "256Mi"},
-                )
-            ]
-        ),
+    _ssa(
+        f"/api/v1/namespaces/{ns}/limitranges/store-limits",
+        {
+            "apiVersion": "v1",
+            "kind": "LimitRange",
+            "metadata": {"name": "store-limits", "namespace": ns},
+            "spec": _LR_SPEC,
+        },
     )
-    try:
-        core.create_namespaced_limit_range(ns, lr)
-    except ApiException as e:
-        if e.status != 409:
-            raise
-        core.patch_namespaced_limit_range(
-            name="store-limits",
-            namespace=ns,
-            body={"spec": {"limits": [lr.spec.limits[0].to_dict()]}},
-        )
 
 
 def apply_networkpolicy_default_deny(ns: str) -> None:
-    policy = client.V1NetworkPolicy(
-        metadata=client.V1ObjectMeta(name="default-deny", namespace=ns),
-        spec=client.V1NetworkPolicySpec(
-            pod_selector=client.V1LabelSelector(match_labels={}),
-            policy_types=["Ingress", "Egress"],
-        ),
+    _ssa(
+        f"/apis/networking.k8s.io/v1/namespaces/{ns}/networkpolicies/default-deny",
+        {
+            "apiVersion": "networking.k8s.io/v1",
+            "kind": "NetworkPolicy",
+            "metadata": {"name": "default-deny", "namespace": ns},
+            "spec": _NP_DENY_SPEC,
+        },
     )
-    try:
-        net.create_namespaced_network_policy(ns, policy)
-    except ApiException as e:
-        if e.status != 409:
-            raise
-        net.patch_namespaced_network_policy(
-            name="default-deny",
-            namespace=ns,
-            body=policy,
-        )
 
 
 def apply_networkpolicy_allow_required(ns: str) -> None:
-    policy = client.V1NetworkPolicy(
-        metadata=client.V1ObjectMeta(name="allow-required", namespace=ns),
-        spec=client.V1NetworkPolicySpec(
-            pod_selector=client.V1LabelSelector(match_labels={}),
-            policy_types=["Ingress", "Egress"],
-            ingress=[
-                client.V1NetworkPolicyIngressRule(
-                    _from=[
-                        client.V1NetworkPolicyPeer(
-                            namespace_selector=client.V1LabelSelector(
-                                match_labels={"kubernetes.io/metadata.name": "ingress-nginx"}
-                            )
-                        ),
-                        client.V1NetworkPolicyPeer(
-                            pod_selector=client.V1LabelSelector(match_labels={})
-                        ),
-                    ]
-                )
-            ],
-            egress=[
-                # intra-namespace app/db traffic
-                client.V1NetworkPolicyEgressRule(
-                    to=[client.V1NetworkPolicyPeer(pod_selector=client.V1LabelSelector(match_labels={}))],
-                ),
-                # dns
-                client.V1NetworkPolicyEgressRule(
-                    to=[
-                        client.V1NetworkPolicyPeer(
-                            namespace_selector=client.V1LabelSelector(
-                                match_labels={"kubernetes.io/metadata.name": "kube-system"}
-                            )
-                        )
-                    ],
-                    ports=[
-                        client.V1NetworkPolicyPort(protocol="UDP", port=53),
-                        client.V1NetworkPolicyPort(protocol="TCP", port=53),
-                    ],
-                ),
-                # external https/http for package/plugin installs and upstream calls
-                client.V1NetworkPolicyEgressRule(
-                    to=[
-                        client.V1NetworkPolicyPeer(
-                            ip_block=client.V1IPBlock(cidr="0.0.0.0/0")
-                        )
-                    ],
-                    ports=[
-                        client.V1NetworkPolicyPort(protocol="TCP", port=443),
-                        client.V1NetworkPolicyPort(protocol="TCP", port=80),
-                    ],
-                ),
-            ],
-        ),
+    _ssa(
+        f"/apis/networking.k8s.io/v1/namespaces/{ns}/networkpolicies/allow-required",
+        {
+            "apiVersion": "networking.k8s.io/v1",
+            "kind": "NetworkPolicy",
+            "metadata": {"name": "allow-required", "namespace": ns},
+            "spec": _NP_ALLOW_SPEC,
+        },
     )
-    try:
-        net.create_namespaced_network_policy(ns, policy)
-    except ApiException as e:
-        if e.status != 409:
-            raise
-        net.patch_namespaced_network_policy(
-            name="allow-required",
-            namespace=ns,
-            body=policy,
-        )
 
 
-def ensure_namespace_resources(ns: str) -> None:
-    apply_resourcequota(ns)
-    apply_limitrange(ns)
+def _apply_networkpolicy_best_effort(apply_fn, ns: str) -> None:
     # If CNI does not support NetworkPolicy, reconcile should continue.
     try:
-        apply_networkpolicy_default_deny(ns)
-        apply_networkpolicy_allow_required(ns)
+        apply_fn(ns)
     except Exception:
         pass
 
 
+def ensure_namespace_resources(ns: str) -> None:
+    # The four objects are independent, so apply them concurrently and pay
+    # one API round trip of wall time instead of four.
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [
+            ex.submit(apply_resourcequota, ns),
+            ex.submit(apply_limitrange, ns),
+            ex.submit(_apply_networkpolicy_best_effort, apply_networkpolicy_default_deny, ns),
+            ex.submit(_apply_networkpolicy_best_effort, apply_networkpolicy_allow_required, ns),
+        ]
+        for future in as_completed(futures):
+            future.result()
+
+
 def ensure_admin_secret(ns: str, store_id: str) -> Tuple[str, str]:
     try:
         sec = core.read_namespaced_secret(ADMIN_SECRET_NAME, ns)
         data = sec.data or {}
-        if "username" in data and "password" in data:
-            username = base64.b64decode(data["username"]).decode("utf-8")
-            password = base64.b64decode(data["password"]).decode("utf-8")
-            if username and password:
-                return username, password
+        # Check the encoded fields first; only decode to str on the return.
+        username_b64 = data.get("username")
+        password_b64 = data.get("password")
+        if username_b64 and password_b64:
+            username_b = base64.b64decode(username_b64)
+            password_b = base64.b64decode(password_b64)
+            if username_b and password_b:
+                return username_b.decode("utf-8"), password_b.decode("utf-8")
     except ApiException as e:
         if e.status != 404:
             raise
 
     username = "admin"
     password = rand_password(20)
-    secret = client.V1Secret(
-        metadata=client.V1ObjectMeta(name=ADMIN_SECRET_NAME, namespace=ns),
-        type="Opaque",
-        string_data={
-            "username": username,
-            "password": password,
-            "storeId": store_id,
+    _ssa(
+        f"/api/v1/namespaces/{ns}/secrets/{ADMIN_SECRET_NAME}",
+        {
+            "apiVersion": "v1",
+            "kind": "Secret",
+            "metadata": {"name": ADMIN_SECRET_NAME, "namespace": ns},
+            "type": "Opaque",
+            "stringData": {
+                "username": username,
+                "password": password,
+                "storeId": store_id,
+            },
         },
     )
-    try:
-        core.create_namespaced_secret(ns, secret)
-    except ApiException as e:
-        if e.status != 409:
-            raise
-        core.patch_namespaced_secret(
-            name=ADMIN_SECRET_NAME,
-            namespace=ns,
-            body={"stringData": secret.string_data, "type": "Opaque"},
-        )
     return username, password
 
 
 def _namespace_is_owned(ns: str, store_id: str) -> bool:
     if not ns.startswith(STORE_NS_PREFIX):
         return False
+    # Positive cache hits are authoritative (the cache lists only managed
+    # namespaces); misses could just be watch lag, so re-check live.
+    if ns_watch_cache.wait_synced():
+        cached = ns_watch_cache.get(ns)
+        if cached is not None:
+            labels = cached.get("metadata", {}).get("labels", {}) or {}
+            return labels.get(STORE_ID_LABEL) == store_id
     try:
         namespace_obj = core.read_namespace(ns)
     except ApiException as e:
@@ -498,7 +929,161 @@ def _namespace_is_owned(ns: str, store_id: str) -> bool:
     return labels.get(STORE_MANAGED_LABEL) == "true" and labels.get(STORE_ID_LABEL) == store_id
 
 
-def reconcile_store(
+# Warm pool: pre-provisioned namespaces whose release is already running
+# against a placeholder hostname. Claiming one replaces the whole
+# namespace+resources+secret+helm sequence with three cheap patches, so the
+# store is Ready in seconds instead of minutes. Claim bookkeeping is
+# process-local; this operator is the only writer of these namespaces.
+_warm_lock = threading.Lock()
+_warm_claimed: set = set()
+_warm_pool_task: Optional["asyncio.Task"] = None
+
+
+def _warm_candidates(engine: str) -> List[Dict]:
+    out = []
+    for obj in ns_watch_cache.values():
+        meta = obj.get("metadata", {}) or {}
+        labels = meta.get("labels", {}) or {}
+        if (
+            labels.get(WARM_POOL_LABEL) == engine
+            and not meta.get("deletionTimestamp")
+            and meta.get("name") not in _warm_claimed
+        ):
+            out.append(obj)
+    return out
+
+
+def _claim_warm_namespace(store_id: str, host: str, engine: str) -> Optional[Tuple[str, str]]:
+    """Claim a warm namespace for a store; returns (namespace, release) or None."""
+    with _warm_lock:
+        candidates = _warm_candidates(engine)
+        if not candidates:
+            return None
+        candidate = candidates[0]
+        ns = candidate.get("metadata", {}).get("name", "")
+        _warm_claimed.add(ns)
+    release = (candidate.get("metadata", {}).get("annotations", {}) or {}).get(
+        WARM_RELEASE_ANNOTATION, ""
+    )
+    try:
+        if not release:
+            raise RuntimeError(f"warm namespace {ns} has no release annotation")
+        # Take ownership: point the labels at the real store and drop the
+        # warm marker so the maintainer stops counting it.
+        core.patch_namespace(
+            ns,
+            {"metadata": {"labels": {STORE_ID_LABEL: store_id, WARM_POOL_LABEL: None}}},
+        )
+        # Repoint every ingress (rules and TLS) at the real hostname.
+        for ing in net.list_namespaced_ingress(ns).items:
+            spec = co.api_client.sanitize_for_serialization(ing.spec) or {}
+            changed = False
+            for rule in spec.get("rules", []) or []:
+                if rule.get("host"):
+                    rule["host"] = host
+                    changed = True
+            for tls in spec.get("tls", []) or []:
+                tls["hosts"] = [host]
+                changed = True
+            if changed:
+                net.patch_namespaced_ingress(ing.metadata.name, ns, {"spec": spec})
+        # Stamp the admin secret with the real storeId.
+        core.patch_namespaced_secret(
+            ADMIN_SECRET_NAME, ns, {"stringData": {"storeId": store_id}}
+        )
+    except Exception:
+        with _warm_lock:
+            _warm_claimed.discard(ns)
+        return None
+    return ns, release
+
+
+async def _provision_warm_namespace(engine: str) -> None:
+    warm_id = f"warm-{secrets.token_hex(4)}"
+    ns = store_namespace(warm_id)
+    handler = ENGINE_HANDLERS[engine]
+    release = handler.build_release_name(warm_id)
+    host = store_host(warm_id)
+
+    await asyncio.to_thread(ensure_namespace, ns, warm_id)
+    await asyncio.to_thread(ensure_namespace_resources, ns)
+    admin_user, admin_password = await asyncio.to_thread(
+        ensure_admin_secret, ns, warm_id
+    )
+    values = handler.build_helm_values(
+        store_id=warm_id,
+        host=host,
+        admin_user=admin_user,
+        admin_password=admin_password,
+    )
+    await run_helm_install(
+        handler,
+        store_id=warm_id,
+        namespace=ns,
+        values=values,
+        timeout=MAX_PROVISION_SECONDS + 60,
+    )
+    await asyncio.to_thread(wait_release_ready, release, ns, MAX_PROVISION_SECONDS)
+    # Label the namespace as warm only now that the release is ready, so it
+    # can never be claimed (and declared Ready) while still installing, and
+    # a failed refill never counts toward the pool.
+    await asyncio.to_thread(
+        core.patch_namespace,
+        ns,
+        {
+            "metadata": {
+                "labels": {WARM_POOL_LABEL: engine},
+                "annotations": {WARM_RELEASE_ANNOTATION: release},
+            }
+        },
+    )
+
+
+async def _warm_pool_maintainer() -> None:
+    # Only woocommerce is warmed; the medusa chart is still a stub.
+    await asyncio.to_thread(ns_watch_cache.wait_synced, 30)
+    while True:
+        try:
+            with _warm_lock:
+                shortfall = STORE_WARM_POOL - len(_warm_candidates("woocommerce"))
+            if shortfall > 0:
+                await _provision_warm_namespace("woocommerce")
+                continue  # re-count immediately until the pool is full
+        except Exception as e:
+            logging.getLogger("warm-pool").warning(f"Warm pool refill failed: {e}")
+        await asyncio.sleep(STORE_WARM_POOL_INTERVAL)
+
+
+async def _provision_worker() -> None:
+    while True:
+        name, generation, run, future = await _provision_queue.get()
+        try:
+            cached = store_watch_cache.get(name) or {}
+            cached_gen = cached.get("metadata", {}).get("generation", 0)
+            if cached and cached_gen > generation:
+                # A newer spec already landed; its own event will reconcile.
+                if not future.done():
+                    future.set_result(
+                        {"skipped": f"superseded by generation {cached_gen}"}
+                    )
+                continue
+            result = await run()
+            if not future.done():
+                future.set_result(result)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            _provision_queue.task_done()
+
+
+async def _run_provisioned(name: str, generation: int, run) -> Dict:
+    future = asyncio.get_running_loop().create_future()
+    await _provision_queue.put((name, generation, run, future))
+    return await future
+
+
+async def reconcile_store(
     *,
     name: str,
     namespace: str,
@@ -513,7 +1098,8 @@ def reconcile_store(
     engine = spec.get("engine", "woocommerce")
     handler = ENGINE_HANDLERS.get(engine)
     if not handler:
-        patch_store_status(
+        await asyncio.to_thread(
+            patch_store_status,
             name,
             phase="Failed",
             event_type="Failed",
@@ -523,113 +1109,191 @@ def reconcile_store(
         raise kopf.PermanentError(f"Unsupported engine '{engine}'")
 
     store_id = spec.get("storeId", name)
-    store_ns = store_namespace(store_id)
     host = store_host(store_id)
-    release = handler.build_release_name(store_id)
+    url = store_url(store_id)
     generation = meta.get("generation", 0)
 
-    add_finalizer(name)
-    patch_store_status(
-        name,
-        phase="Provisioning",
-        event_type="ProvisioningStarted",
-        event_message=f"Starting reconcile for {engine}",
-        set_fields={
-            "url": store_url(store_id),
+    # As in on_delete, prefer the namespace/release recorded in status: a
+    # warm-claimed store lives in a namespace not derived from the storeId,
+    # and recomputing would orphan it and provision a second one.
+    recorded = await asyncio.to_thread(_load_status, name)
+    store_ns = recorded.get("namespace") or store_namespace(store_id)
+    release = recorded.get("releaseName") or handler.build_release_name(store_id)
+
+    # Per-phase generation markers (status.phases) make the reconcile
+    # level-based: a phase that already succeeded for this generation is
+    # skipped, so a resume after a partial failure only redoes what broke.
+    phases: Dict = dict(recorded.get("phases", {}) or {})
+
+    def _phase_current(phase: str) -> bool:
+        return (phases.get(phase) or {}).get("observedGeneration") == generation
+
+    await asyncio.to_thread(add_finalizer, name)
+    status = StatusAccumulator(name)
+
+    def _mark_phase(phase: str) -> None:
+        phases[phase] = {"observedGeneration": generation}
+        status.set_fields({"phases": dict(phases)})
+    status.set_phase("Provisioning").add_event(
+        "ProvisioningStarted", f"Starting reconcile for {engine}"
+    ).set_fields(
+        {
+            "url": url,
             "namespace": store_ns,
             "releaseName": release,
             "observedGeneration": generation,
             "lastError": None,
-        },
-        drop_fields=["adminPassword", "adminUser"],
-    )
-
-    acquired = _provision_semaphore.acquire(timeout=MAX_PROVISION_SECONDS)
-    if not acquired:
-        patch_store_status(
-            name,
-            phase="Failed",
-            event_type="Failed",
-            event_message="Provisioning lock timeout",
-            set_fields={"lastError": "Provisioning lock timeout"},
-        )
-        raise kopf.TemporaryError("Provisioning lock timeout", delay=15)
+        }
+    ).drop_fields("adminPassword", "adminUser")
+    await asyncio.to_thread(status.flush)
 
     try:
-        patch_store_status(
-            name,
-            event_type="NamespaceReady",
-            event_message=f"Ensuring namespace {store_ns}",
-            set_fields={"namespace": store_ns},
-        )
-        ensure_namespace(store_ns, store_id)
-        ensure_namespace_resources(store_ns)
-
-        admin_user, admin_password = ensure_admin_secret(store_ns, store_id)
-        patch_store_status(
-            name,
-            event_type="HelmInstallStarted",
-            event_message=f"Installing/upgrading release {release}",
-        )
-
-        helm_args = handler.build_helm_args(
-            store_id=store_id,
-            namespace=store_ns,
-            host=host,
-            admin_user=admin_user,
-            admin_password=admin_password,
+        # A warm namespace (release already running) short-circuits the whole
+        # provisioning sequence; any claim failure falls back to the full
+        # path. Only stores that never got a namespace (no marker from any
+        # generation) may claim, so a retry or spec bump keeps working in
+        # the namespace it already has instead of grabbing a second one.
+        claim = None
+        if (
+            STORE_WARM_POOL > 0
+            and not phases.get("Namespace")
+            and not _phase_current("HelmRelease")
+        ):
+            claim = await asyncio.to_thread(
+                _claim_warm_namespace, store_id, host, engine
+            )
+        if claim:
+            store_ns, release = claim
+            status.add_event(
+                "WarmNamespaceClaimed", f"Claimed warm namespace {store_ns}"
+            )
+            status.set_fields({"namespace": store_ns, "releaseName": release})
+            for phase in ("Namespace", "Resources", "Secret", "HelmRelease"):
+                _mark_phase(phase)
+            await asyncio.to_thread(
+                handler.post_ready_checks, store_id=store_id, namespace=store_ns
+            )
+
+            status.set_phase("Ready").add_event(
+                "Ready", f"Store ready at {url}"
+            ).set_fields(
+                {
+                    "url": url,
+                    "readyAt": now_iso(),
+                    "releaseName": release,
+                    "namespace": store_ns,
+                    "observedGeneration": generation,
+                    "lastError": None,
+                }
+            ).drop_fields("adminPassword", "adminUser")
+            await asyncio.to_thread(status.flush)
+            return {"namespace": store_ns, "host": host, "releaseName": release}
+
+        # Namespace: trust the marker only if the informer cache agrees the
+        # namespace still exists with our labels (guards against drift).
+        if not (
+            _phase_current("Namespace")
+            and await asyncio.to_thread(_namespace_is_owned, store_ns, store_id)
+        ):
+            status.add_event("NamespaceReady", f"Ensuring namespace {store_ns}")
+            status.set_fields({"namespace": store_ns})
+            await asyncio.to_thread(ensure_namespace, store_ns, store_id)
+            _mark_phase("Namespace")
+
+        if not _phase_current("Resources"):
+            await asyncio.to_thread(ensure_namespace_resources, store_ns)
+            _mark_phase("Resources")
+
+        if _phase_current("HelmRelease"):
+            logger.info(f"Release {release} already current for generation {generation}")
+        else:
+            admin_user, admin_password = await asyncio.to_thread(
+                ensure_admin_secret, store_ns, store_id
+            )
+            _mark_phase("Secret")
+            # Flush once before the long helm step so progress is visible
+            # while the release installs.
+            status.add_event(
+                "HelmInstallStarted", f"Installing/upgrading release {release}"
+            )
+            await asyncio.to_thread(status.flush)
+
+            helm_values = handler.build_helm_values(
+                store_id=store_id,
+                host=host,
+                admin_user=admin_user,
+                admin_password=admin_password,
+            )
+            await run_helm_install(
+                handler,
+                store_id=store_id,
+                namespace=store_ns,
+                values=helm_values,
+                timeout=MAX_PROVISION_SECONDS + 60,
+            )
+            await asyncio.to_thread(
+                wait_release_ready, release, store_ns, MAX_PROVISION_SECONDS
+            )
+            _mark_phase("HelmRelease")
+        await asyncio.to_thread(
+            handler.post_ready_checks, store_id=store_id, namespace=store_ns
         )
-        run_helm(helm_args, timeout=MAX_PROVISION_SECONDS + 60)
-        handler.post_ready_checks(store_id=store_id, namespace=store_ns)
 
-        patch_store_status(
-            name,
-            phase="Ready",
-            event_type="Ready",
-            event_message=f"Store ready at {store_url(store_id)}",
-            set_fields={
-                "url": store_url(store_id),
+        status.set_phase("Ready").add_event(
+            "Ready", f"Store ready at {url}"
+        ).set_fields(
+            {
+                "url": url,
                 "readyAt": now_iso(),
                 "releaseName": release,
                 "namespace": store_ns,
                 "observedGeneration": generation,
                 "lastError": None,
-            },
-            drop_fields=["adminPassword", "adminUser"],
-        )
+            }
+        ).drop_fields("adminPassword", "adminUser")
+        await asyncio.to_thread(status.flush)
         return {"namespace": store_ns, "host": host, "releaseName": release}
     except Exception as e:
-        patch_store_status(
-            name,
-            phase="Failed",
-            event_type="Failed",
-            event_message=str(e),
-            set_fields={
+        # Any events buffered before the failure flush together with it.
+        status.set_phase("Failed").add_event("Failed", str(e)).set_fields(
+            {
                 "lastError": str(e),
                 "releaseName": release,
                 "namespace": store_ns,
                 "observedGeneration": generation,
-            },
-            drop_fields=["adminPassword", "adminUser"],
-        )
+            }
+        ).drop_fields("adminPassword", "adminUser")
+        await asyncio.to_thread(status.flush)
         raise
-    finally:
-        _provision_semaphore.release()
 
 
 @kopf.on.startup()
-def configure(settings: kopf.OperatorSettings, **_) -> None:
+async def configure(settings: kopf.OperatorSettings, **_) -> None:
     settings.posting.enabled = True
     settings.execution.max_workers = OPERATOR_WORKERS
+    store_watch_cache.start()
+    ns_watch_cache.start()
+    global _provision_queue, _warm_pool_task
+    _provision_queue = asyncio.Queue()
+    for _ in range(MAX_CONCURRENT_PROVISIONS):
+        _provision_workers.append(asyncio.create_task(_provision_worker()))
+    if STORE_WARM_POOL > 0:
+        _warm_pool_task = asyncio.create_task(_warm_pool_maintainer())
 
 
 @kopf.on.create(CRD_GROUP, CRD_VERSION, CRD_PLURAL)
-def on_create(spec, name, namespace, meta, logger, **_):
-    return reconcile_store(name=name, namespace=namespace, spec=spec, meta=meta, logger=logger)
+async def on_create(spec, name, namespace, meta, logger, **_):
+    return await _run_provisioned(
+        name,
+        meta.get("generation", 0),
+        lambda: reconcile_store(
+            name=name, namespace=namespace, spec=spec, meta=meta, logger=logger
+        ),
+    )
 
 
 @kopf.on.resume(CRD_GROUP, CRD_VERSION, CRD_PLURAL)
-def on_resume(spec, status, name, namespace, meta, logger, **_):
+async def on_resume(spec, status, name, namespace, meta, logger, **_):
     if namespace != PLATFORM_NAMESPACE:
         return
     if meta.get("deletionTimestamp"):
@@ -639,22 +1303,32 @@ def on_resume(spec, status, name, namespace, meta, logger, **_):
         "generation", 0
     ):
         return
-    return reconcile_store(name=name, namespace=namespace, spec=spec, meta=meta, logger=logger)
+    return await _run_provisioned(
+        name,
+        meta.get("generation", 0),
+        lambda: reconcile_store(
+            name=name, namespace=namespace, spec=spec, meta=meta, logger=logger
+        ),
+    )
 
 
 @kopf.on.delete(CRD_GROUP, CRD_VERSION, CRD_PLURAL)
-def on_delete(spec, name, namespace, logger, **_):
+async def on_delete(spec, name, namespace, logger, **_):
     if namespace != PLATFORM_NAMESPACE:
         return
 
     engine = spec.get("engine", "woocommerce")
     store_id = spec.get("storeId", name)
     handler = ENGINE_HANDLERS.get(engine, ENGINE_HANDLERS["woocommerce"])
-    store_ns = store_namespace(store_id)
-    release = handler.build_release_name(store_id)
+    # Warm-claimed stores live in a namespace (and release) not derived from
+    # the storeId, so prefer what status recorded during provisioning.
+    recorded = await asyncio.to_thread(_load_status, name)
+    store_ns = recorded.get("namespace") or store_namespace(store_id)
+    release = recorded.get("releaseName") or handler.build_release_name(store_id)
 
     try:
-        patch_store_status(
+        await asyncio.to_thread(
+            patch_store_status,
             name,
             phase="Deleting",
             event_type="Deleting",
@@ -662,18 +1336,19 @@ def on_delete(spec, name, namespace, logger, **_):
             set_fields={"namespace": store_ns, "releaseName": release},
         )
         try:
-            run_helm(["uninstall", release, "-n", store_ns], timeout=300)
+            await run_helm(["uninstall", release, "-n", store_ns], timeout=300)
         except Exception:
             pass
 
-        if _namespace_is_owned(store_ns, store_id):
+        if await asyncio.to_thread(_namespace_is_owned, store_ns, store_id):
             try:
-                core.delete_namespace(store_ns)
+                await asyncio.to_thread(core.delete_namespace, store_ns)
             except ApiException as e:
                 if e.status != 404:
                     raise
 
-        patch_store_status(
+        await asyncio.to_thread(
+            patch_store_status,
             name,
             phase="Deleted",
             event_type="Deleted",
@@ -681,6 +1356,7 @@ def on_delete(spec, name, namespace, logger, **_):
         )
     finally:
         try:
-            remove_finalizer(name)
+            await asyncio.to_thread(remove_finalizer, name)
         except Exception as e:
             logger.warning(f"Finalizer removal warning: {e}")
+        _forget_status(name)